@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+AI News Aggregator - Report History CLI
+
+Query the indexed archive of past reports and their articles, e.g.:
+
+    python history.py query --category LLM --source "Ars Technica" --since 7d
+    python history.py query "open weights" --since 2024-05-01
+    python history.py show 2024-05-01
+"""
+
+from storage.report_archive import main
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Per-stage LLM routing configuration.
+
+Each agent or task stage maps to a fallback chain of routes. A route names an
+Ollama model together with its own sampling and context limits. The first
+route whose model is pulled on the Ollama server is used, so small quantized
+models can handle closed-set stages (categorization, relevance) while the
+reporter keeps the full Llama 3 model.
+
+The chain is walked once, when the LLMs are created at startup. A model that
+fails or disappears mid-run is not replaced by the next route.
+
+Routes can be overridden with a JSON file of the same shape as LLM_ROUTES,
+e.g. {"categorizer": [{"model": "ollama/qwen2.5:3b", "temperature": 0.0}]}.
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+from crewai import LLM
+
+OLLAMA_BASE_URL = "http://localhost:11434"
+
+SMALL_MODEL = "ollama/llama3.2:3b"
+LARGE_MODEL = "ollama/llama3"
+
+LLM_ROUTES: Dict[str, List[Dict[str, Any]]] = {
+    "default": [
+        {"model": LARGE_MODEL, "temperature": 0.7},
+    ],
+    "scraper": [
+        {"model": SMALL_MODEL, "temperature": 0.1, "num_ctx": 8192, "num_predict": 2048},
+        {"model": LARGE_MODEL, "temperature": 0.1, "num_ctx": 8192, "num_predict": 2048},
+    ],
+    "summarizer": [
+        {"model": SMALL_MODEL, "temperature": 0.3, "num_ctx": 8192, "num_predict": 2048},
+        {"model": LARGE_MODEL, "temperature": 0.3, "num_ctx": 8192, "num_predict": 2048},
+    ],
+    "categorizer": [
+        {"model": SMALL_MODEL, "temperature": 0.0, "num_ctx": 8192, "num_predict": 1536},
+        {"model": LARGE_MODEL, "temperature": 0.0, "num_ctx": 8192, "num_predict": 1536},
+    ],
+    "reporter": [
+        {"model": LARGE_MODEL, "temperature": 0.7, "num_ctx": 8192, "num_predict": 3072},
+    ],
+    "report_section": [
+        {"model": LARGE_MODEL, "temperature": 0.7, "num_ctx": 4096, "num_predict": 768},
+    ],
+    "report_assembly": [
+        {"model": SMALL_MODEL, "temperature": 0.5, "num_ctx": 4096, "num_predict": 512},
+        {"model": LARGE_MODEL, "temperature": 0.5, "num_ctx": 4096, "num_predict": 512},
+    ],
+}
+
+
+def load_routes(path: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """Load the routing table, applying overrides from a JSON file.
+
+    Args:
+        path: Optional JSON file whose stages replace the default ones
+
+    Returns:
+        Mapping of stage name to its fallback chain of routes
+
+    Raises:
+        ValueError: If an override names an unknown stage or a route has no model
+    """
+    routes = {stage: list(chain) for stage, chain in LLM_ROUTES.items()}
+    if path:
+        with open(path, encoding="utf-8") as f:
+            overrides = json.load(f)
+        if not isinstance(overrides, dict):
+            raise ValueError(f"{path} must contain a JSON object of stage routes")
+        for stage, chain in overrides.items():
+            if stage not in LLM_ROUTES:
+                raise ValueError(
+                    f"Unknown stage '{stage}' in {path}, "
+                    f"expected one of: {', '.join(LLM_ROUTES)}"
+                )
+            chain = [chain] if isinstance(chain, dict) else list(chain)
+            if not chain:
+                raise ValueError(f"Stage '{stage}' in {path} has no routes")
+            for route in chain:
+                if not isinstance(route, dict) or not route.get("model"):
+                    raise ValueError(
+                        f"Route for stage '{stage}' in {path} has no \"model\": {route}"
+                    )
+            routes[stage] = chain
+    return routes
+
+
+def _model_tag(model: str) -> str:
+    """Normalize "ollama/llama3" to the "llama3:latest" form Ollama reports."""
+    name = model.split("/", 1)[1] if model.startswith("ollama/") else model
+    return name if ":" in name else f"{name}:latest"
+
+
+def list_ollama_models(base_url: str = OLLAMA_BASE_URL) -> Optional[set]:
+    """List the models pulled on the Ollama server.
+
+    Args:
+        base_url: Ollama server URL
+
+    Returns:
+        Set of model tags, or None if the server could not be queried
+    """
+    import requests
+
+    try:
+        response = requests.get(f"{base_url}/api/tags", timeout=5)
+        response.raise_for_status()
+        return {m["name"] for m in response.json().get("models", [])}
+    except (requests.RequestException, ValueError, KeyError):
+        return None
+
+
+def select_route(
+    stage: str,
+    routes: Dict[str, List[Dict[str, Any]]],
+    available_models: Optional[set] = None,
+) -> Dict[str, Any]:
+    """Pick the first route in a stage's fallback chain that can be served.
+
+    Args:
+        stage: Agent or task stage name (falls back to "default")
+        routes: Routing table from load_routes
+        available_models: Pulled model tags, or None to skip the check
+
+    Returns:
+        The selected route, or the last route of the chain if none of its
+        models is pulled (or the server could not be queried)
+    """
+    chain = routes.get(stage) or routes["default"]
+    if available_models is not None:
+        for route in chain:
+            if _model_tag(route["model"]) in available_models:
+                return route
+        print(
+            f"[!] No model for stage '{stage}' is pulled "
+            f"({', '.join(route['model'] for route in chain)}), "
+            f"using {chain[-1]['model']}"
+        )
+    return chain[-1]
+
+
+def create_llm(
+    stage: str = "default",
+    routes: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    available_models: Optional[set] = None,
+    base_url: str = OLLAMA_BASE_URL,
+) -> LLM:
+    """Create the Ollama LLM routed to a stage.
+
+    Args:
+        stage: Agent or task stage name
+        routes: Routing table (defaults to LLM_ROUTES)
+        available_models: Pulled model tags used to walk the fallback chain
+        base_url: Ollama server URL
+
+    Returns:
+        Configured LLM instance for the stage
+    """
+    route = select_route(stage, routes or LLM_ROUTES, available_models)
+    params = {}
+    if route.get("num_predict"):
+        params["max_tokens"] = route["num_predict"]
+    if route.get("num_ctx"):
+        params["num_ctx"] = route["num_ctx"]
+
+    return LLM(
+        model=route["model"],
+        base_url=base_url,
+        temperature=route.get("temperature", 0.7),
+        **params,
+    )
@@ -8,12 +8,13 @@ the latest AI news using CrewAI and Ollama (Llama 3).
 Author: Yunus Emre Hoş
 """
 
+import argparse
 import os
 import sys
 from datetime import datetime
 from pathlib import Path
 
-from crewai import Crew, Process, LLM
+from crewai import Crew, Process
 
 from agents import (
     create_scraper_agent,
@@ -26,8 +27,14 @@ from tasks import (
     create_summarization_task,
     create_categorization_task,
     create_reporting_task,
+    set_precomputed_trends,
+    assign_categories,
+    write_fanout_report,
 )
+from storage import ReportArchive, TermIndex, format_trends
 from tools import AINewsScraper
+from llm_routes import create_llm, list_ollama_models, load_routes
+from pipeline import SCRAPE_WORKERS, run_pipeline
 
 
 def check_ollama_connection() -> bool:
@@ -45,17 +52,26 @@ def check_ollama_connection() -> bool:
         return False
 
 
-def create_llm():
-    """Create and configure the Ollama LLM.
+def create_stage_llms(routes_file: str = None) -> dict:
+    """Create one routed Ollama LLM per agent/task stage.
+
+    Args:
+        routes_file: Optional JSON file overriding the default routes
 
     Returns:
-        Configured LLM instance for Ollama
+        Mapping of stage name to configured LLM instance
     """
-    return LLM(
-        model="ollama/llama3",
-        base_url="http://localhost:11434",
-        temperature=0.7,
-    )
+    routes = load_routes(routes_file)
+    available = list_ollama_models()
+    if available is None:
+        print("[!] Could not list Ollama models, using the last route of each stage")
+    llms = {}
+    for stage in routes:
+        if stage == "default":
+            continue
+        llms[stage] = create_llm(stage, routes, available)
+        print(f"    {stage:<16} -> {llms[stage].model}")
+    return llms
 
 
 def setup_output_directory():
@@ -65,37 +81,53 @@ def setup_output_directory():
     return output_dir
 
 
-def run_news_aggregator():
-    """Run the AI News Aggregator crew."""
-    print("=" * 60)
-    print("   AI NEWS AGGREGATOR")
-    print("   Powered by CrewAI + Ollama (Llama 3)")
-    print("=" * 60)
-    print()
+def print_memory_stats(scraper_tool: AINewsScraper):
+    """Print the page and parse tree size of each scraped source.
 
-    # Check Ollama connection
-    print("[*] Checking Ollama connection...")
-    if not check_ollama_connection():
-        print("[!] ERROR: Cannot connect to Ollama.")
-        print("    Please ensure Ollama is running:")
-        print("    1. Install Ollama: https://ollama.ai")
-        print("    2. Run: ollama run llama3")
-        print("    3. Try again")
-        sys.exit(1)
-    print("[+] Ollama connection successful!")
+    Args:
+        scraper_tool: The scraper tool used during the run
+    """
+    if not scraper_tool.memory_stats:
+        return
+    print("--- SCRAPER MEMORY ---")
+    for url, stats in scraper_tool.memory_stats.items():
+        print(
+            f"    {stats['page_bytes'] / 1024:8.1f} KiB page, "
+            f"{stats['tree_bytes'] / 1024:8.1f} KiB parse tree  {url}"
+        )
+    peaks = [
+        stats["process_peak_bytes"]
+        for stats in scraper_tool.memory_stats.values()
+        if "process_peak_bytes" in stats
+    ]
+    if peaks:
+        print(f"    Process-wide traced peak while scraping: {max(peaks) / 1024:.1f} KiB")
     print()
 
-    # Setup
-    setup_output_directory()
-    llm = create_llm()
-    scraper_tool = AINewsScraper()
 
+def build_crew(
+    llms: dict,
+    scraper_tool: AINewsScraper,
+    term_index: TermIndex,
+    fanout_report: bool = False,
+):
+    """Create the agents, tasks and crew.
+
+    Args:
+        llms: Routed LLMs per stage
+        scraper_tool: The scraper tool
+        term_index: Historical term index used for the trend list
+        fanout_report: Leave the reporting task out of the crew
+
+    Returns:
+        Tuple of (crew, categorization task, trends dict filled after scraping)
+    """
     # Create agents
     print("[*] Initializing agents...")
-    scraper_agent = create_scraper_agent(llm, tools=[scraper_tool])
-    summarizer_agent = create_summarizer_agent(llm)
-    categorizer_agent = create_categorizer_agent(llm)
-    reporter_agent = create_reporter_agent(llm)
+    scraper_agent = create_scraper_agent(llms["scraper"], tools=[scraper_tool])
+    summarizer_agent = create_summarizer_agent(llms["summarizer"])
+    categorizer_agent = create_categorizer_agent(llms["categorizer"])
+    reporter_agent = create_reporter_agent(llms["reporter"])
     print("[+] Agents initialized!")
     print()
 
@@ -114,17 +146,93 @@ def run_news_aggregator():
     print("[+] Tasks created!")
     print()
 
-    # Create and run crew
+    # Trends are computed from the term index once today's articles are in it
+    trends = {}
+
+    def compute_trends(_output):
+        trends["text"] = format_trends(term_index.trending_terms())
+        set_precomputed_trends(reporting_task, trends["text"])
+
+    scraping_task.callback = compute_trends
+
+    agents = [scraper_agent, summarizer_agent, categorizer_agent, reporter_agent]
+    tasks = [scraping_task, summarization_task, categorization_task, reporting_task]
+    if fanout_report:
+        # The report is written outside the crew, section by section
+        agents, tasks = agents[:-1], tasks[:-1]
+
+    # Create crew
     print("[*] Assembling crew...")
     crew = Crew(
-        agents=[scraper_agent, summarizer_agent, categorizer_agent, reporter_agent],
-        tasks=[scraping_task, summarization_task, categorization_task, reporting_task],
+        agents=agents,
+        tasks=tasks,
         process=Process.sequential,
         verbose=True,
     )
     print("[+] Crew assembled!")
     print()
 
+    return crew, categorization_task, trends
+
+
+def run_news_aggregator(
+    fanout_report: bool = False,
+    routes_file: str = None,
+    pipeline: bool = False,
+    trace_memory: bool = False,
+    scrape_workers: int = SCRAPE_WORKERS,
+):
+    """Run the AI News Aggregator crew.
+
+    Args:
+        fanout_report: Generate report sections as concurrent LLM calls
+            instead of a single reporter task
+        routes_file: Optional JSON file overriding the per-stage LLM routes
+        pipeline: Stream articles through bounded queues between stages
+            instead of running the crew stage by stage
+        trace_memory: Trace the process-wide peak memory while scraping
+        scrape_workers: Sources scraped concurrently in pipeline mode
+    """
+    print("=" * 60)
+    print("   AI NEWS AGGREGATOR")
+    print("   Powered by CrewAI + Ollama (Llama 3)")
+    print("=" * 60)
+    print()
+
+    # Check Ollama connection
+    print("[*] Checking Ollama connection...")
+    if not check_ollama_connection():
+        print("[!] ERROR: Cannot connect to Ollama.")
+        print("    Please ensure Ollama is running:")
+        print("    1. Install Ollama: https://ollama.ai")
+        print("    2. Run: ollama run llama3")
+        print("    3. Try again")
+        sys.exit(1)
+    print("[+] Ollama connection successful!")
+    print()
+
+    # Setup
+    setup_output_directory()
+    print("[*] Routing models...")
+    llms = create_stage_llms(routes_file)
+    print()
+    term_index = TermIndex()
+    archive = ReportArchive()
+    # The scraper agent may call the tool more than once for the same page
+    scraped_articles = {}
+
+    def on_articles(articles):
+        for article in articles:
+            scraped_articles.setdefault(article.get("url") or article["title"], article)
+        term_index.add_articles(articles)
+
+    scraper_tool = AINewsScraper(on_articles=on_articles, trace_memory=trace_memory)
+
+    if not pipeline:
+        crew, categorization_task, trends = build_crew(
+            llms, scraper_tool, term_index, fanout_report
+        )
+
     print("=" * 60)
     print("   STARTING NEWS AGGREGATION")
     print(f"   Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -132,7 +240,28 @@ def run_news_aggregator():
     print()
 
     try:
-        result = crew.kickoff()
+        if pipeline:
+            print("[*] Streaming articles through the pipeline...")
+            result, articles = run_pipeline(
+                scraper_tool,
+                llms,
+                trends=lambda: format_trends(term_index.trending_terms()),
+                scrape_workers=scrape_workers,
+            )
+        else:
+            result = crew.kickoff()
+            articles = list(scraped_articles.values())
+            assign_categories(articles, categorization_task.output.raw)
+
+        if fanout_report and not pipeline:
+            print("[*] Generating report sections concurrently...")
+            result = write_fanout_report(
+                llms["report_section"],
+                categorization_task.output.raw,
+                trends=trends.get("text"),
+                assembly_llm=llms["report_assembly"],
+                articles=articles,
+            )
 
         print()
         print("=" * 60)
@@ -140,7 +269,13 @@ def run_news_aggregator():
         print("=" * 60)
         print()
         print(f"[+] Report saved to: outputs/daily_report.md")
+        try:
+            run_id = archive.add_report(str(result), articles)
+            print(f"[+] Archived as {run_id} (query with: python history.py query)")
+        except Exception as e:
+            print(f"[!] Archiving failed: {e}")
         print()
+        print_memory_stats(scraper_tool)
         print("--- FINAL REPORT ---")
         print(result)
 
@@ -154,10 +289,58 @@ def run_news_aggregator():
         raise
 
 
+def parse_args(argv=None):
+    """Parse command line arguments.
+
+    Args:
+        argv: Argument list (defaults to sys.argv)
+
+    Returns:
+        Parsed arguments namespace
+    """
+    parser = argparse.ArgumentParser(description="AI News Aggregator")
+    parser.add_argument(
+        "--fanout-report",
+        action="store_true",
+        help="generate each report section as a concurrent LLM call",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="stream articles through scrape/summarize/categorize as they "
+        "arrive (always uses the fan-out report)",
+    )
+    parser.add_argument(
+        "--scrape-workers",
+        type=int,
+        default=SCRAPE_WORKERS,
+        metavar="N",
+        help=f"sources scraped concurrently in pipeline mode (default: {SCRAPE_WORKERS})",
+    )
+    parser.add_argument(
+        "--llm-routes",
+        metavar="PATH",
+        help="JSON file overriding the per-stage model routes",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="report the process-wide peak memory while scraping (tracemalloc, slower)",
+    )
+    return parser.parse_args(argv)
+
+
 def main():
     """Main entry point."""
+    args = parse_args()
     try:
-        run_news_aggregator()
+        run_news_aggregator(
+            fanout_report=args.fanout_report,
+            routes_file=args.llm_routes,
+            pipeline=args.pipeline,
+            trace_memory=args.trace_memory,
+            scrape_workers=args.scrape_workers,
+        )
     except Exception as e:
         print(f"[!] Fatal error: {e}")
         sys.exit(1)
@@ -0,0 +1,96 @@
+"""AI news sources and categories, with the name matching shared across stages.
+
+This module only uses the standard library, so the archive CLI can resolve
+category and source names without importing the crew, the LLM client or the
+scraper.
+"""
+
+import re
+from typing import Optional
+from urllib.parse import urlparse
+
+NEWS_SOURCES = [
+    {
+        "name": "MIT Technology Review - AI",
+        "url": "https://www.technologyreview.com/topic/artificial-intelligence/",
+        "type": "tech_review",
+    },
+    {
+        "name": "VentureBeat AI",
+        "url": "https://venturebeat.com/category/ai/",
+        "type": "tech_news",
+    },
+    {
+        "name": "The Verge - AI",
+        "url": "https://www.theverge.com/ai-artificial-intelligence",
+        "type": "tech_news",
+    },
+    {
+        "name": "Ars Technica - AI",
+        "url": "https://arstechnica.com/ai/",
+        "type": "tech_news",
+    },
+    {
+        "name": "TechCrunch - AI",
+        "url": "https://techcrunch.com/category/artificial-intelligence/",
+        "type": "tech_news",
+    },
+]
+
+AI_CATEGORIES = [
+    "Large Language Models (LLM)",
+    "Computer Vision",
+    "Natural Language Processing (NLP)",
+    "Reinforcement Learning",
+    "Robotics & Automation",
+    "AI Ethics & Safety",
+    "AI Business & Industry",
+    "AI Research & Papers",
+    "Generative AI",
+    "Machine Learning",
+]
+
+
+def source_for_url(url: str) -> str:
+    """Return the name of the configured source serving a URL.
+
+    Args:
+        url: A source page or article URL
+
+    Returns:
+        The source name, or the URL's host if no source matches
+    """
+    host = urlparse(url).netloc.lower().removeprefix("www.")
+    for source in NEWS_SOURCES:
+        if urlparse(source["url"]).netloc.lower().removeprefix("www.") == host:
+            return source["name"]
+    return host
+
+
+def _normalize(name: str) -> str:
+    """Lowercase a category name and strip punctuation for loose matching."""
+    name = name.lower().replace("&", " and ")
+    return " ".join(re.sub(r"[^a-z0-9 ]", " ", name).split())
+
+
+def match_category(heading: str) -> Optional[str]:
+    """Map a heading written by the categorizer onto one of AI_CATEGORIES.
+
+    Args:
+        heading: Heading text, e.g. "Large Language Models" or "LLM"
+
+    Returns:
+        The matching category name, or None if the heading is not a category
+    """
+    norm = _normalize(heading)
+    for category in AI_CATEGORIES:
+        candidates = {
+            _normalize(category),
+            _normalize(re.sub(r"\(.*?\)", "", category)),
+        }
+        abbrev = re.search(r"\((.*?)\)", category)
+        if abbrev:
+            candidates.add(_normalize(abbrev.group(1)))
+        if norm in candidates:
+            return category
+    return None
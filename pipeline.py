@@ -0,0 +1,254 @@
+"""Pipelined execution - articles stream through bounded queues between stages.
+
+The crew runs its stages one after another, so summarization waits for every
+source to be scraped and categorization waits for every summary. In pipeline
+mode each source's articles go to summarization as soon as that source is
+scraped, and each summary goes straight on to categorization:
+
+    scrape (per source) -> [queue] -> summarize -> [queue] -> categorize
+
+The queues are bounded, so a fast stage blocks instead of piling up work
+ahead of a slow one. Only the final report waits for the full article set.
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from news_catalog import AI_CATEGORIES, NEWS_SOURCES, match_category
+from tasks.report_sections import write_fanout_report
+from tools import AINewsScraper
+
+QUEUE_SIZE = 8
+# Sources scraped at once; kept low so the pipeline does not hit every site
+# (and hold every page in memory) at the same time
+SCRAPE_WORKERS = 2
+FALLBACK_CATEGORY = "Machine Learning"
+
+_DONE = object()
+
+
+def _summarize(llm, article: Dict[str, Any]) -> Dict[str, Any]:
+    """Add a 2-3 sentence summary to an article."""
+    prompt = f"""Summarize this AI news article in 2-3 sentences. Say what happened
+or was announced and why it matters for the AI field. Reply with the summary only.
+
+Title: {article.get('title', '')}
+Source: {article.get('source', '')}
+Description: {article.get('description', '') or 'N/A'}"""
+    try:
+        article["summary"] = str(llm.call([{"role": "user", "content": prompt}])).strip()
+    except Exception as e:
+        print(f"[!] Summarization failed for '{article.get('title')}': {e}")
+        article["summary"] = article.get("description", "")
+    return article
+
+
+def _categorize(llm, article: Dict[str, Any]) -> Dict[str, Any]:
+    """Assign one primary category from AI_CATEGORIES to an article."""
+    categories_list = "\n".join(f"- {cat}" for cat in AI_CATEGORIES)
+    prompt = f"""Pick the single best category for this AI news article.
+
+Categories:
+{categories_list}
+
+Title: {article.get('title', '')}
+Summary: {article.get('summary', '')}
+
+Reply with the category name only."""
+    category = None
+    try:
+        reply = str(llm.call([{"role": "user", "content": prompt}])).strip()
+        category = match_category(reply.strip("-*# .\"'")) or next(
+            (cat for cat in AI_CATEGORIES if cat.lower() in reply.lower()), None
+        )
+    except Exception as e:
+        print(f"[!] Categorization failed for '{article.get('title')}': {e}")
+    if not category:
+        print(f"[!] No category for '{article.get('title')}', using {FALLBACK_CATEGORY}")
+        category = FALLBACK_CATEGORY
+    article["category"] = category
+    return article
+
+
+def _start_stage(
+    name: str,
+    func: Callable[[Dict[str, Any]], Dict[str, Any]],
+    inbox: queue.Queue,
+    outbox: queue.Queue,
+    workers: int,
+    downstream_workers: int = 1,
+) -> threading.Thread:
+    """Run a stage's workers and signal the next stage once they all finish.
+
+    Args:
+        name: Stage name used for thread names
+        func: Function applied to every article
+        inbox: Queue the stage reads from, terminated by one _DONE per worker
+        outbox: Queue the stage writes to
+        workers: Number of concurrent workers
+        downstream_workers: Number of _DONE markers to send downstream
+
+    Returns:
+        The coordinating thread
+    """
+
+    def work():
+        while True:
+            article = inbox.get()
+            if article is _DONE:
+                return
+            outbox.put(func(article))
+
+    def coordinate():
+        threads = [
+            threading.Thread(target=work, name=f"{name}-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for _ in range(downstream_workers):
+            outbox.put(_DONE)
+
+    coordinator = threading.Thread(target=coordinate, name=name, daemon=True)
+    coordinator.start()
+    return coordinator
+
+
+def stream_articles(
+    scraper_tool: AINewsScraper,
+    summarizer_llm,
+    categorizer_llm,
+    max_articles: int = 5,
+    scrape_workers: int = SCRAPE_WORKERS,
+    summarize_workers: int = 2,
+    categorize_workers: int = 2,
+    queue_size: int = QUEUE_SIZE,
+) -> List[Dict[str, Any]]:
+    """Scrape, summarize and categorize articles as a streaming pipeline.
+
+    Args:
+        scraper_tool: The scraper tool (its on_articles hook is honoured)
+        summarizer_llm: The language model for summaries
+        categorizer_llm: The language model for categories
+        max_articles: Maximum articles per source
+        scrape_workers: Sources scraped concurrently
+        summarize_workers: Concurrent summarization calls
+        categorize_workers: Concurrent categorization calls
+        queue_size: Capacity of each inter-stage queue
+
+    Returns:
+        Categorized article dictionaries, in completion order
+    """
+    to_summarize: queue.Queue = queue.Queue(maxsize=queue_size)
+    to_categorize: queue.Queue = queue.Queue(maxsize=queue_size)
+    done: queue.Queue = queue.Queue()
+
+    _start_stage(
+        "summarize",
+        lambda a: _summarize(summarizer_llm, a),
+        to_summarize,
+        to_categorize,
+        summarize_workers,
+        downstream_workers=categorize_workers,
+    )
+    categorize = _start_stage(
+        "categorize",
+        lambda a: _categorize(categorizer_llm, a),
+        to_categorize,
+        done,
+        categorize_workers,
+    )
+
+    def scrape(source: Dict[str, str]):
+        try:
+            articles = scraper_tool.scrape_articles(source["url"], max_articles)
+        except Exception as e:
+            print(f"[!] Error scraping {source['name']}: {e}")
+            return
+        print(f"[+] {source['name']}: {len(articles)} articles")
+        if articles and scraper_tool.on_articles:
+            try:
+                scraper_tool.on_articles(articles)
+            except Exception as e:
+                print(f"[!] Article hook failed for {source['name']}: {e}")
+        for article in articles:
+            to_summarize.put(article)
+
+    with ThreadPoolExecutor(max_workers=max(1, scrape_workers)) as executor:
+        list(executor.map(scrape, NEWS_SOURCES))
+    for _ in range(summarize_workers):
+        to_summarize.put(_DONE)
+
+    results = []
+    while True:
+        item = done.get()
+        if item is _DONE:
+            break
+        results.append(item)
+    categorize.join()
+    return results
+
+
+def render_categorized(articles: List[Dict[str, Any]]) -> str:
+    """Render categorized articles in the categorization task's format.
+
+    Args:
+        articles: Output of stream_articles
+
+    Returns:
+        Text accepted by the fan-out report builder
+    """
+    lines = ["CATEGORIZED NEWS", "================"]
+    for category in AI_CATEGORIES:
+        members = [a for a in articles if a.get("category") == category]
+        if not members:
+            continue
+        lines.extend(["", f"## {category}"])
+        for i, article in enumerate(members, 1):
+            lines.append(f"{i}. {article.get('title', 'N/A')}")
+            lines.append(f"   Source: {article.get('source', 'N/A')}")
+            lines.append(f"   Summary: {article.get('summary', '')}")
+    return "\n".join(lines)
+
+
+def run_pipeline(
+    scraper_tool: AINewsScraper,
+    llms: Dict[str, Any],
+    trends: Optional[Callable[[], str]] = None,
+    output_file: str = "outputs/daily_report.md",
+    scrape_workers: int = SCRAPE_WORKERS,
+) -> Tuple[str, List[Dict[str, Any]]]:
+    """Run the whole aggregation as a pipeline and write the daily report.
+
+    Args:
+        scraper_tool: The scraper tool
+        llms: Routed LLMs per stage (see main.create_stage_llms)
+        trends: Optional callable returning the precomputed trend list,
+            called once all articles have been scraped
+        output_file: Where to write the finished report
+        scrape_workers: Sources scraped concurrently
+
+    Returns:
+        Tuple of (report Markdown, categorized articles)
+    """
+    articles = stream_articles(
+        scraper_tool,
+        llms["summarizer"],
+        llms["categorizer"],
+        scrape_workers=scrape_workers,
+    )
+    print(f"[+] Pipeline processed {len(articles)} articles")
+
+    report = write_fanout_report(
+        llms["report_section"],
+        render_categorized(articles),
+        output_file=output_file,
+        trends=trends() if trends else None,
+        assembly_llm=llms["report_assembly"],
+        articles=articles,
+    )
+    return report, articles
@@ -0,0 +1,4 @@
+from .term_index import TermIndex, format_trends
+from .report_archive import ReportArchive
+
+__all__ = ["TermIndex", "format_trends", "ReportArchive"]
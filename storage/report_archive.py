@@ -0,0 +1,375 @@
+"""Indexed archive of daily reports and their article data.
+
+Every run stores its report and structured articles as gzip-compressed files
+under a dated directory, and records the articles in a SQLite index with
+date, category and source columns plus an FTS5 full-text table over titles
+and summaries. History queries hit the index only, so they come back in
+milliseconds without re-reading any archived file.
+
+Query from the command line, e.g. all LLM stories of the last week from
+Ars Technica:
+
+    python history.py query --category LLM --source "Ars Technica" --since 7d
+"""
+
+import argparse
+import gzip
+import json
+import re
+import sqlite3
+import sys
+import time
+from contextlib import closing
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from news_catalog import AI_CATEGORIES, NEWS_SOURCES, match_category
+
+DEFAULT_ARCHIVE_DIR = "outputs/archive"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL UNIQUE,
+    day TEXT NOT NULL,
+    report_path TEXT NOT NULL,
+    articles_path TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    report_id INTEGER NOT NULL REFERENCES reports (id),
+    day TEXT NOT NULL,
+    source TEXT NOT NULL DEFAULT '',
+    category TEXT NOT NULL DEFAULT '',
+    title TEXT NOT NULL,
+    url TEXT NOT NULL DEFAULT '',
+    summary TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_reports_day ON reports (day);
+CREATE INDEX IF NOT EXISTS idx_articles_day ON articles (day);
+CREATE INDEX IF NOT EXISTS idx_articles_category ON articles (category, day);
+CREATE INDEX IF NOT EXISTS idx_articles_source ON articles (source, day);
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5 (
+    title, summary, content='articles', content_rowid='id'
+);
+"""
+
+
+def parse_since(value: str, now: Optional[datetime] = None) -> str:
+    """Parse a relative ("7d", "2w") or absolute (YYYY-MM-DD) start date.
+
+    Args:
+        value: The date expression
+        now: Reference time (defaults to now)
+
+    Returns:
+        Day in YYYY-MM-DD format
+    """
+    match = re.fullmatch(r"(\d+)([dw])", value.strip().lower())
+    if not match:
+        return datetime.strptime(value, "%Y-%m-%d").strftime("%Y-%m-%d")
+    days = int(match.group(1)) * (7 if match.group(2) == "w" else 1)
+    return ((now or datetime.now()) - timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def resolve_categories(value: str) -> List[str]:
+    """Resolve a category filter to canonical AI_CATEGORIES names.
+
+    Args:
+        value: A category name, abbreviation or fragment, e.g. "LLM"
+
+    Returns:
+        Matching category names
+
+    Raises:
+        ValueError: If no category matches
+    """
+    category = match_category(value)
+    if category:
+        return [category]
+    matches = [cat for cat in AI_CATEGORIES if value.lower() in cat.lower()]
+    if not matches:
+        raise ValueError(
+            f"Unknown category '{value}', expected one of: {', '.join(AI_CATEGORIES)}"
+        )
+    return matches
+
+
+def resolve_sources(value: str) -> List[str]:
+    """Resolve a source filter to canonical NEWS_SOURCES names.
+
+    Args:
+        value: A source name or fragment, e.g. "Ars Technica"
+
+    Returns:
+        Matching source names, or the value itself if no configured source
+        matches (articles from unknown hosts are stored under their host)
+    """
+    names = [source["name"] for source in NEWS_SOURCES]
+    exact = [name for name in names if name.lower() == value.lower()]
+    return exact or [name for name in names if value.lower() in name.lower()] or [value]
+
+
+def _since_arg(value: str) -> str:
+    """argparse type for --since, turning bad input into a usage error."""
+    try:
+        return parse_since(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid date '{value}', use YYYY-MM-DD or a relative age like 7d or 2w"
+        )
+
+
+def _day_arg(value: str) -> str:
+    """argparse type for --until."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").strftime("%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}', use YYYY-MM-DD")
+
+
+def _fts_query(text: str) -> str:
+    """Quote each word so user input is never parsed as FTS5 syntax."""
+    return " ".join('"{}"'.format(word.replace('"', '""')) for word in text.split())
+
+
+class ReportArchive:
+    """Dated, compressed report archive with a SQLite query index."""
+
+    def __init__(self, root: str = DEFAULT_ARCHIVE_DIR):
+        """Open (and create if needed) the archive.
+
+        Args:
+            root: Archive root directory
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.root / "index.db"
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def add_report(
+        self,
+        report: str,
+        articles: List[Dict[str, Any]],
+        when: Optional[datetime] = None,
+    ) -> str:
+        """Archive a report with its articles and index them.
+
+        Args:
+            report: The report Markdown
+            articles: Article dictionaries (title, url, source, category,
+                summary or description)
+            when: Run time (defaults to now)
+
+        Returns:
+            The run id, e.g. "2024-05-01_083000_123456"
+        """
+        when = when or datetime.now()
+        day = when.strftime("%Y-%m-%d")
+        run_dir = self.root / when.strftime("%Y") / when.strftime("%m")
+        run_dir.mkdir(parents=True, exist_ok=True)
+
+        # The index row claims the run id before any file is written, so a
+        # colliding run can never overwrite another run's files. Files are
+        # written inside the transaction, so a failed write leaves no row.
+        with closing(self._connect()) as conn, conn:
+            base_id = when.strftime("%Y-%m-%d_%H%M%S_%f")
+            for attempt in range(100):
+                run_id = base_id if attempt == 0 else f"{base_id}-{attempt}"
+                report_path = run_dir / f"{run_id}.report.md.gz"
+                articles_path = run_dir / f"{run_id}.articles.json.gz"
+                try:
+                    report_id = conn.execute(
+                        """INSERT INTO reports (run_id, day, report_path, articles_path)
+                        VALUES (?, ?, ?, ?)""",
+                        (
+                            run_id,
+                            day,
+                            str(report_path.relative_to(self.root)),
+                            str(articles_path.relative_to(self.root)),
+                        ),
+                    ).lastrowid
+                    break
+                except sqlite3.IntegrityError:
+                    continue
+            else:
+                raise RuntimeError(f"Could not allocate a run id for {base_id}")
+
+            for article in articles:
+                summary = article.get("summary") or article.get("description", "")
+                cur = conn.execute(
+                    """INSERT INTO articles
+                    (report_id, day, source, category, title, url, summary)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                    (
+                        report_id,
+                        day,
+                        article.get("source", ""),
+                        article.get("category", ""),
+                        article.get("title", ""),
+                        article.get("url", ""),
+                        summary,
+                    ),
+                )
+                conn.execute(
+                    "INSERT INTO articles_fts (rowid, title, summary) VALUES (?, ?, ?)",
+                    (cur.lastrowid, article.get("title", ""), summary),
+                )
+
+            with gzip.open(report_path, "xt", encoding="utf-8") as f:
+                f.write(report)
+            with gzip.open(articles_path, "xt", encoding="utf-8") as f:
+                json.dump(articles, f, ensure_ascii=False)
+
+        return run_id
+
+    def query(
+        self,
+        text: Optional[str] = None,
+        category: Optional[str] = None,
+        source: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """Search archived articles.
+
+        Category and source filters are resolved to their canonical names
+        first, so "LLM" matches "Large Language Models (LLM)" and
+        "Ars Technica" matches "Ars Technica - AI", and then compared with
+        equality so the category and source indexes are used. A story
+        archived by several runs is returned once, from its latest run.
+
+        Args:
+            text: Full-text query over titles and summaries
+            category: Category filter
+            source: Source filter
+            since: First day (YYYY-MM-DD or relative, e.g. "7d")
+            until: Last day (YYYY-MM-DD)
+            limit: Maximum number of results
+
+        Returns:
+            Matching articles, newest first
+
+        Raises:
+            ValueError: If the category or a date cannot be resolved
+        """
+        # Latest matching row per story, keyed by url (or title if no url)
+        sql = ["SELECT MAX(a.id) FROM articles a"]
+        where, params = [], []
+        if text:
+            sql.append("JOIN articles_fts f ON f.rowid = a.id")
+            where.append("articles_fts MATCH ?")
+            params.append(_fts_query(text))
+        if category:
+            categories = resolve_categories(category)
+            where.append(f"a.category IN ({', '.join('?' * len(categories))})")
+            params.extend(categories)
+        if source:
+            sources = resolve_sources(source)
+            where.append(f"a.source IN ({', '.join('?' * len(sources))})")
+            params.extend(sources)
+        if since:
+            where.append("a.day >= ?")
+            params.append(parse_since(since))
+        if until:
+            where.append("a.day <= ?")
+            params.append(until)
+        if where:
+            sql.append("WHERE " + " AND ".join(where))
+        sql.append("GROUP BY CASE WHEN a.url != '' THEN a.url ELSE a.title END")
+        params.append(limit)
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"""SELECT a.day, a.source, a.category, a.title, a.url, a.summary,
+                    r.run_id
+                FROM articles a JOIN reports r ON r.id = a.report_id
+                WHERE a.id IN ({" ".join(sql)})
+                ORDER BY a.day DESC, a.id LIMIT ?""",
+                params,
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def load_report(self, run_id_or_day: str) -> Optional[str]:
+        """Load an archived report.
+
+        Args:
+            run_id_or_day: A run id, or a day to load that day's latest report
+
+        Returns:
+            The report Markdown, or None if not archived
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                """SELECT report_path FROM reports
+                WHERE run_id = ? OR day = ?
+                ORDER BY run_id DESC LIMIT 1""",
+                (run_id_or_day, run_id_or_day),
+            ).fetchone()
+        if not row:
+            return None
+        with gzip.open(self.root / row["report_path"], "rt", encoding="utf-8") as f:
+            return f.read()
+
+
+def main(argv=None):
+    """Command line interface for querying the archive."""
+    parser = argparse.ArgumentParser(description="Query the AI news report archive")
+    parser.add_argument("--archive", default=DEFAULT_ARCHIVE_DIR, help="archive directory")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    query = commands.add_parser("query", help="search archived articles")
+    query.add_argument("text", nargs="?", help="full-text search over titles and summaries")
+    query.add_argument("--category", help='category filter, e.g. "LLM"')
+    query.add_argument("--source", help='source filter, e.g. "Ars Technica"')
+    query.add_argument(
+        "--since", type=_since_arg, help='first day, YYYY-MM-DD or relative, e.g. "7d"'
+    )
+    query.add_argument("--until", type=_day_arg, help="last day, YYYY-MM-DD")
+    query.add_argument("--limit", type=int, default=50)
+    query.add_argument("--json", action="store_true", help="print results as JSON")
+
+    show = commands.add_parser("show", help="print an archived report")
+    show.add_argument("run", help="run id or day (YYYY-MM-DD)")
+
+    args = parser.parse_args(argv)
+    archive = ReportArchive(args.archive)
+
+    if args.command == "show":
+        report = archive.load_report(args.run)
+        if report is None:
+            print(f"[!] No archived report for {args.run}")
+            sys.exit(1)
+        print(report)
+        return
+
+    started = time.perf_counter()
+    try:
+        results = archive.query(
+            text=args.text,
+            category=args.category,
+            source=args.source,
+            since=args.since,
+            until=args.until,
+            limit=args.limit,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    elapsed = (time.perf_counter() - started) * 1000
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return
+    for result in results:
+        print(f"{result['day']}  [{result['category'] or '-'}]  {result['title']}")
+        print(f"            {result['source'] or '-'}  {result['url']}")
+    print(f"\n{len(results)} results in {elapsed:.1f} ms")
+
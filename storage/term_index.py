@@ -0,0 +1,312 @@
+"""Historical term index for computing emerging trends across days.
+
+Every scraped article is reduced to a set of terms (capitalized entities and
+word n-grams from its title and description) and the per-day document counts
+are stored in a compact SQLite table. Trend detection is then a single
+aggregate query comparing a recent window against a trailing baseline,
+which takes milliseconds even over months of history.
+"""
+
+import math
+import re
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+DEFAULT_DB_PATH = "outputs/news_history.db"
+
+STOPWORDS = frozenset(
+    """
+    a about after all also an and any are as at be been before but by can could
+    did do does for from had has have how if in into is it its just more most
+    new no not now of on one or our out over says said so than that the their
+    them then there these they this those to up us was we were what when where
+    which who why will with would you your
+    """.split()
+)
+
+_WORD_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9\-\.']*[A-Za-z0-9]|[A-Za-z0-9]")
+_ENTITY_RE = re.compile(r"\b[A-Z][\w\-]*(?:\s+[A-Z][\w\-]*){1,3}")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS indexed_articles (
+    key TEXT PRIMARY KEY,
+    day TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS term_counts (
+    term TEXT NOT NULL,
+    day TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (term, day)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_term_counts_day ON term_counts (day, term);
+"""
+
+
+def extract_terms(text: str, max_ngram: int = 2) -> Set[str]:
+    """Extract the indexable terms of a piece of text.
+
+    Terms are lowercased word n-grams that do not start or end with a
+    stopword, plus multi-word capitalized phrases (e.g. "Google DeepMind").
+    Capitalized phrases are split at stopwords, so "Meta And Google" yields
+    no entity rather than "meta google". Title Case text capitalizes every
+    word, so no entities are taken from it.
+
+    Args:
+        text: A title or description
+        max_ngram: Longest word n-gram to extract
+
+    Returns:
+        Set of terms, so each term counts once per article
+    """
+    terms = set()
+
+    if not _is_title_case(text):
+        for match in _ENTITY_RE.finditer(text):
+            run: List[str] = []
+            for word in match.group(0).split() + [""]:
+                if word and word.lower() not in STOPWORDS:
+                    run.append(word)
+                    continue
+                if len(run) > 1:
+                    terms.add(" ".join(run).lower())
+                run = []
+
+    words = [w.lower().strip(".'") for w in _WORD_RE.findall(text)]
+    for n in range(1, max_ngram + 1):
+        for i in range(len(words) - n + 1):
+            gram = words[i : i + n]
+            if gram[0] in STOPWORDS or gram[-1] in STOPWORDS:
+                continue
+            if n == 1 and (len(gram[0]) < 3 or gram[0].isdigit()):
+                continue
+            terms.add(" ".join(gram))
+
+    return terms
+
+
+def _is_title_case(text: str) -> bool:
+    """Whether most non-stopwords of a headline-length text are capitalized."""
+    words = [
+        w
+        for w in _WORD_RE.findall(text)
+        if w.lower() not in STOPWORDS and not w[0].isdigit()
+    ]
+    if len(words) < 4:
+        return False
+    capitalized = sum(1 for w in words if w[0].isupper())
+    return capitalized >= 0.9 * len(words)
+
+
+def _shift_day(day: str, days: int) -> str:
+    return (datetime.strptime(day, "%Y-%m-%d") + timedelta(days=days)).strftime(
+        "%Y-%m-%d"
+    )
+
+
+class TermIndex:
+    """Inverted index of daily term counts over stored articles."""
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        """Open (and create if needed) the index database.
+
+        Args:
+            db_path: Path of the SQLite database file
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+    def add_articles(
+        self, articles: Iterable[Dict[str, Any]], day: Optional[str] = None
+    ) -> int:
+        """Index articles under the given day, skipping ones already indexed.
+
+        Args:
+            articles: Article dictionaries with title, url and description
+            day: Day in YYYY-MM-DD format (defaults to today)
+
+        Returns:
+            Number of newly indexed articles
+        """
+        day = day or datetime.now().strftime("%Y-%m-%d")
+        counts: Dict[str, int] = {}
+        added = 0
+
+        with self._lock, closing(self._connect()) as conn, conn:
+            for article in articles:
+                title = article.get("title", "")
+                key = article.get("url") or title
+                if not key:
+                    continue
+                cur = conn.execute(
+                    "INSERT OR IGNORE INTO indexed_articles (key, day) VALUES (?, ?)",
+                    (key, day),
+                )
+                if not cur.rowcount:
+                    continue
+                added += 1
+                terms = extract_terms(title) | extract_terms(
+                    article.get("description", "")
+                )
+                for term in terms:
+                    counts[term] = counts.get(term, 0) + 1
+
+            conn.executemany(
+                """INSERT INTO term_counts (term, day, count) VALUES (?, ?, ?)
+                ON CONFLICT (term, day) DO UPDATE SET count = count + excluded.count""",
+                [(term, day, count) for term, count in counts.items()],
+            )
+
+        return added
+
+    def term_history(self, term: str, days: int = 30, end_day: Optional[str] = None):
+        """Return the daily counts of a single term.
+
+        Args:
+            term: The term to look up (case-insensitive)
+            days: Number of days to return, ending at end_day
+            end_day: Last day in YYYY-MM-DD format (defaults to today)
+
+        Returns:
+            List of (day, count) tuples, oldest first, including zero days
+        """
+        end_day = end_day or datetime.now().strftime("%Y-%m-%d")
+        start_day = _shift_day(end_day, -(days - 1))
+        with closing(self._connect()) as conn:
+            rows = dict(
+                conn.execute(
+                    """SELECT day, count FROM term_counts
+                    WHERE term = ? AND day BETWEEN ? AND ?""",
+                    (term.lower(), start_day, end_day),
+                ).fetchall()
+            )
+        return [
+            (day, rows.get(day, 0))
+            for day in (_shift_day(start_day, i) for i in range(days))
+        ]
+
+    def trending_terms(
+        self,
+        day: Optional[str] = None,
+        window_days: int = 1,
+        baseline_days: int = 7,
+        min_count: int = 2,
+        limit: int = 10,
+        min_baseline_days: int = 3,
+        max_day_fraction: float = 0.6,
+    ) -> List[Dict[str, Any]]:
+        """Find terms rising in a recent window relative to a trailing baseline.
+
+        The burst score is a Poisson-style z-score of the window count against
+        the count expected from the baseline daily rate (with add-one
+        smoothing so brand new terms still score). The rate is taken over the
+        baseline days that actually have data. Until the index holds
+        min_baseline_days of baseline data nothing is returned, since every
+        term would look new. Terms present on most baseline days are
+        background vocabulary ("model", "ai") and are skipped.
+
+        Args:
+            day: Last day of the recent window (defaults to today)
+            window_days: Length of the recent window in days
+            baseline_days: Length of the baseline preceding the window
+            min_count: Minimum window count for a term to be considered
+            limit: Maximum number of trends to return
+            min_baseline_days: Baseline days with data required before
+                any trend is reported
+            max_day_fraction: Skip terms seen on more than this fraction
+                of the baseline days with data
+
+        Returns:
+            List of dicts with term, count, baseline_rate and score, best first
+        """
+        day = day or datetime.now().strftime("%Y-%m-%d")
+        window_start = _shift_day(day, -(window_days - 1))
+        baseline_start = _shift_day(window_start, -baseline_days)
+
+        with closing(self._connect()) as conn:
+            (active_days,) = conn.execute(
+                """SELECT COUNT(DISTINCT day) FROM term_counts
+                WHERE day >= ? AND day < ?""",
+                (baseline_start, window_start),
+            ).fetchone()
+            if active_days < min_baseline_days:
+                return []
+
+            rows = conn.execute(
+                """SELECT term,
+                    SUM(CASE WHEN day >= :window_start THEN count ELSE 0 END),
+                    SUM(CASE WHEN day < :window_start THEN count ELSE 0 END),
+                    COUNT(CASE WHEN day < :window_start THEN 1 END)
+                FROM term_counts
+                WHERE day BETWEEN :baseline_start AND :day
+                GROUP BY term
+                HAVING SUM(CASE WHEN day >= :window_start THEN count ELSE 0 END)
+                    >= :min_count""",
+                {
+                    "window_start": window_start,
+                    "baseline_start": baseline_start,
+                    "day": day,
+                    "min_count": min_count,
+                },
+            ).fetchall()
+
+        trends = []
+        for term, count, baseline, present_days in rows:
+            if present_days > max_day_fraction * active_days:
+                continue
+            rate = (baseline + 1) / (active_days + 1)
+            expected = rate * window_days
+            score = (count - expected) / math.sqrt(expected)
+            if score > 0:
+                trends.append(
+                    {
+                        "term": term,
+                        "count": count,
+                        "baseline_rate": round(baseline / active_days, 2),
+                        "score": round(score, 2),
+                    }
+                )
+
+        trends.sort(key=lambda t: (-t["score"], -t["term"].count(" "), t["term"]))
+        return _drop_subsumed(trends)[:limit]
+
+
+def _drop_subsumed(trends: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop terms contained in a longer, at least as strong, trending phrase."""
+    kept = []
+    for trend in trends:
+        words = f" {trend['term']} "
+        if any(
+            words in f" {other['term']} " and other["count"] >= trend["count"]
+            for other in kept
+        ):
+            continue
+        kept.append(trend)
+    return kept
+
+
+def format_trends(trends: List[Dict[str, Any]]) -> str:
+    """Format trending terms as a numbered list for the reporter.
+
+    Args:
+        trends: Output of TermIndex.trending_terms
+
+    Returns:
+        Formatted string, or an empty string if there are no trends
+    """
+    lines = []
+    for i, trend in enumerate(trends, 1):
+        lines.append(
+            f"{i}. {trend['term']}: {trend['count']} articles "
+            f"(baseline {trend['baseline_rate']}/day, burst score {trend['score']})"
+        )
+    return "\n".join(lines)
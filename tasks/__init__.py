@@ -3,11 +3,16 @@ from .news_tasks import (
     create_summarization_task,
     create_categorization_task,
     create_reporting_task,
+    set_precomputed_trends,
 )
+from .report_sections import assign_categories, write_fanout_report
 
 __all__ = [
     "create_scraping_task",
     "create_summarization_task",
     "create_categorization_task",
     "create_reporting_task",
+    "set_precomputed_trends",
+    "assign_categories",
+    "write_fanout_report",
 ]
@@ -231,3 +231,24 @@ Powered by CrewAI + Ollama (Llama 3)
         context=context,
         output_file="outputs/daily_report.md",
     )
+
+
+def set_precomputed_trends(task: Task, trends: str) -> None:
+    """Add a precomputed trend list to the reporting task description.
+
+    Called once today's articles have been indexed, so the reporter uses the
+    historical trend scores instead of guessing trends from one day of news.
+
+    Args:
+        task: The reporting task
+        trends: Formatted trend list (see storage.format_trends)
+    """
+    if not trends:
+        return
+
+    task.description += f"""
+
+PRECOMPUTED EMERGING TRENDS (terms rising against their 7-day baseline,
+computed from the historical article index). Base the Emerging Trends
+section on these:
+{trends}"""
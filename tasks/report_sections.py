@@ -0,0 +1,430 @@
+"""Fan-out report generation - writes each report section as its own LLM call.
+
+Instead of asking the reporter to produce the whole daily report in one
+generation, every populated category section is generated concurrently from
+its own article list, and the top stories, notable mentions and executive
+summary from a compact one-line-per-article digest. A final assembly step
+stitches the sections together without another LLM call, so wall time
+follows the slowest section rather than the sum of all of them.
+"""
+
+import difflib
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from news_catalog import AI_CATEGORIES, match_category
+
+SECTION_SYSTEM_PROMPT = """You are a seasoned technology journalist writing one
+section of a daily AI news report. Write only the requested section in clean
+Markdown, without a section heading, preamble or closing remarks. Use only the
+articles you are given and never invent stories, sources or numbers."""
+
+TOP_STORIES_KEY = "top_stories"
+NOTABLE_MENTIONS_KEY = "notable_mentions"
+EXECUTIVE_SUMMARY_KEY = "executive_summary"
+
+_HEADING_RE = re.compile(r"^\s*#{1,6}\s*(.+?)\s*$")
+_BOLD_HEADING_RE = re.compile(r"^\s*\*\*(.+?)\*\*\s*:?\s*$")
+_HEADING_NUMBER_RE = re.compile(r"^\s*\d+\s*[.):-]\s*")
+_HEADING_COUNT_RE = re.compile(
+    r"\s*(?:[-:]\s*)?[(\[]?\s*\d+\s*(?:articles?|stories|story|items?)?\s*[)\]]?\s*:?\s*$",
+    re.I,
+)
+_TRAILER_RE = re.compile(r"^\s*(CATEGORY STATISTICS|TRENDING TOPICS)\s*:", re.I)
+_TRENDING_RE = re.compile(r"^\s*TRENDING TOPICS\s*:\s*(.*)$", re.I | re.M)
+_ITEM_RE = re.compile(r"^\s*\d+[.)]\s+\S", re.M)
+_ITEM_TITLE_RE = re.compile(r"^\s*\d+[.)]\s+(?:Title:\s*)?(.+?)\s*$", re.M | re.I)
+_SOURCE_LINE_RE = re.compile(r"^\s*Source:\s*([^|\n]+)", re.I)
+
+TITLE_MATCH_CUTOFF = 0.8
+
+
+def _heading_category(heading: str) -> Optional[str]:
+    """Match a heading after stripping leading numbering and trailing counts.
+
+    Handles categorizer variations such as "3. Generative AI" and
+    "LLM (3 articles)".
+    """
+    heading = _HEADING_NUMBER_RE.sub("", heading.strip("*: "))
+    return match_category(heading) or match_category(_HEADING_COUNT_RE.sub("", heading))
+
+
+def split_categorized_output(text: str) -> Dict[str, str]:
+    """Split the categorization task output into per-category bodies.
+
+    Args:
+        text: Raw output of the categorization task
+
+    Returns:
+        Mapping of category name to its article list, in AI_CATEGORIES order,
+        containing only categories that actually have articles
+    """
+    bodies: Dict[str, List[str]] = {}
+    current = None
+
+    for line in text.splitlines():
+        if _TRAILER_RE.match(line):
+            current = None
+            continue
+        heading = _HEADING_RE.match(line)
+        if heading:
+            current = _heading_category(heading.group(1))
+            if current:
+                bodies.setdefault(current, [])
+            continue
+        # Bold lines only start a section when they name a category, since
+        # article titles are often written in bold too
+        bold = _BOLD_HEADING_RE.match(line)
+        if bold and _heading_category(bold.group(1)):
+            current = _heading_category(bold.group(1))
+            bodies.setdefault(current, [])
+            continue
+        if current:
+            bodies[current].append(line)
+
+    sections = {}
+    for category in AI_CATEGORIES:
+        body = "\n".join(bodies.get(category, [])).strip()
+        if body and body.lower().strip(" .-") not in ("none", "n/a"):
+            sections[category] = body
+    return sections
+
+
+def extract_trending_topics(text: str) -> str:
+    """Return the categorizer's TRENDING TOPICS line, if present."""
+    match = _TRENDING_RE.search(text)
+    return match.group(1).strip() if match else ""
+
+
+def _normalize_title(title: str) -> str:
+    """Lowercase a title and drop Markdown and punctuation for comparison."""
+    return " ".join(re.sub(r"[^a-z0-9 ]", " ", title.lower()).split())
+
+
+def assign_categories(articles: List[Dict[str, Any]], categorized_text: str) -> None:
+    """Set each article's category from the numbered entry the categorizer wrote.
+
+    Titles are compared to each category's numbered entries after
+    normalization; an exact match wins, otherwise the closest entry above
+    TITLE_MATCH_CUTOFF similarity is used, so lightly paraphrased titles are
+    still categorized.
+
+    Args:
+        articles: Article dictionaries, updated in place
+        categorized_text: Raw output of the categorization task
+    """
+    entries: Dict[str, str] = {}
+    for category, body in split_categorized_output(categorized_text).items():
+        for title in _ITEM_TITLE_RE.findall(body):
+            entries.setdefault(_normalize_title(title), category)
+
+    for article in articles:
+        title = _normalize_title(article.get("title", ""))
+        if not title:
+            continue
+        if title in entries:
+            article["category"] = entries[title]
+            continue
+        close = difflib.get_close_matches(
+            title, list(entries), n=1, cutoff=TITLE_MATCH_CUTOFF
+        )
+        if close:
+            article["category"] = entries[close[0]]
+
+
+def count_articles(sections: Dict[str, str]) -> int:
+    """Count the numbered article entries across category bodies."""
+    return sum(len(_ITEM_RE.findall(body)) for body in sections.values())
+
+
+def count_sources(
+    sections: Dict[str, str], articles: Optional[List[Dict[str, Any]]] = None
+) -> int:
+    """Count the distinct sources behind the report.
+
+    Args:
+        sections: Per-category article bodies from split_categorized_output
+        articles: Structured articles, preferred when available
+
+    Returns:
+        Number of distinct sources
+    """
+    if articles:
+        return len({a["source"] for a in articles if a.get("source")})
+    lines = re.findall(r"Source:\s*([^|\n]+)", "\n".join(sections.values()))
+    return len({line.strip() for line in lines})
+
+
+def _category_prompt(category: str, body: str) -> str:
+    return f"""Write the "{category}" section of today's AI news report.
+
+Articles in this category:
+{body}
+
+Write one Markdown bullet per article: the title in bold followed by a
+one or two sentence brief."""
+
+
+def compact_digest(sections: Dict[str, str]) -> str:
+    """Reduce category bodies to one "title | source | category" line per article.
+
+    Cross-category sections only need to know what the stories are, so they
+    get this digest instead of every category body.
+
+    Args:
+        sections: Per-category article bodies from split_categorized_output
+
+    Returns:
+        The digest, one article per line
+    """
+    lines = []
+    for category, body in sections.items():
+        entries = []
+        for line in body.splitlines():
+            item = _ITEM_TITLE_RE.match(line)
+            if item:
+                entries.append([item.group(1).strip("*[] "), ""])
+                continue
+            source = _SOURCE_LINE_RE.match(line)
+            if source and entries and not entries[-1][1]:
+                entries[-1][1] = source.group(1).strip()
+        for title, source in entries:
+            lines.append(" | ".join(part for part in (title, source, category) if part))
+    return "\n".join(f"- {line}" for line in lines)
+
+
+def _top_stories_prompt(digest: str) -> str:
+    return f"""Select the 3-5 most significant stories of the day from the articles
+below (title | source | category) and write the TOP STORIES section of the report.
+
+{digest}
+
+Use this format for each story:
+
+### 1. [Story Title]
+[One or two sentences on why it matters]
+Source: [Source Name] | Category: [Category]"""
+
+
+def _notable_mentions_prompt(digest: str) -> str:
+    return f"""List the companies, technologies and researchers mentioned in
+the article titles below.
+
+{digest}
+
+Use exactly this format:
+- **Companies**: [comma separated list]
+- **Technologies**: [comma separated list]
+- **Researchers/Figures**: [comma separated list]"""
+
+
+def _executive_summary_prompt(digest: str) -> str:
+    return f"""Write a 2-3 paragraph executive summary of the day's most important
+AI developments based on these articles (title | source | category):
+
+{digest}"""
+
+
+def _call(llm, prompt: str) -> str:
+    messages = [
+        {"role": "system", "content": SECTION_SYSTEM_PROMPT},
+        {"role": "user", "content": prompt},
+    ]
+    return str(llm.call(messages)).strip()
+
+
+def generate_report_sections(
+    llm,
+    sections: Dict[str, str],
+    max_workers: Optional[int] = None,
+    summary_llm=None,
+) -> Dict[str, str]:
+    """Generate every report section as an independent, concurrent LLM call.
+
+    A section whose call fails falls back to the categorizer's own text, so a
+    single bad generation never loses a whole category from the report.
+
+    Args:
+        llm: The language model to use
+        sections: Per-category article bodies from split_categorized_output
+        max_workers: Maximum concurrent calls (defaults to one per section)
+        summary_llm: Cheaper model for the executive summary (defaults to llm)
+
+    Returns:
+        Mapping of section key (category name, TOP_STORIES_KEY,
+        NOTABLE_MENTIONS_KEY or EXECUTIVE_SUMMARY_KEY) to generated Markdown
+    """
+    prompts = {cat: _category_prompt(cat, body) for cat, body in sections.items()}
+    fallbacks = dict(sections)
+    if sections:
+        digest = compact_digest(sections)
+        prompts[TOP_STORIES_KEY] = _top_stories_prompt(digest)
+        prompts[NOTABLE_MENTIONS_KEY] = _notable_mentions_prompt(digest)
+        prompts[EXECUTIVE_SUMMARY_KEY] = _executive_summary_prompt(digest)
+        fallbacks[TOP_STORIES_KEY] = "See the category breakdown below."
+        fallbacks[NOTABLE_MENTIONS_KEY] = "- None identified"
+        fallbacks[EXECUTIVE_SUMMARY_KEY] = "See the top stories below."
+
+    if not prompts:
+        return {}
+
+    models = {key: llm for key in prompts}
+    models[EXECUTIVE_SUMMARY_KEY] = summary_llm or llm
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers or len(prompts)) as executor:
+        futures = {
+            key: executor.submit(_call, models[key], p) for key, p in prompts.items()
+        }
+        for key, future in futures.items():
+            try:
+                results[key] = future.result() or fallbacks[key]
+            except Exception as e:
+                print(f"[!] Section '{key}' failed, using categorizer text: {e}")
+                results[key] = fallbacks[key]
+    return results
+
+
+def assemble_report(
+    generated: Dict[str, str],
+    sections: Dict[str, str],
+    trends: str = "",
+    report_date: Optional[str] = None,
+    articles: Optional[List[Dict[str, Any]]] = None,
+) -> str:
+    """Stitch generated sections into the final daily report.
+
+    Every section, including the executive summary, was generated
+    concurrently, so this is plain string assembly.
+
+    Args:
+        generated: Output of generate_report_sections
+        sections: Per-category article bodies from split_categorized_output
+        trends: Emerging trends text for the EMERGING TRENDS section
+        report_date: Report date (defaults to today)
+        articles: Structured articles used for the source statistic
+
+    Returns:
+        The complete report as Markdown
+    """
+    report_date = report_date or datetime.now().strftime("%Y-%m-%d")
+    top_stories = generated.get(TOP_STORIES_KEY, "No stories collected today.")
+    summary = generated.get(EXECUTIVE_SUMMARY_KEY, "No stories collected today.")
+
+    parts = [
+        "# AI NEWS DAILY REPORT",
+        f"Date: {report_date}",
+        "",
+        "## EXECUTIVE SUMMARY",
+        summary,
+        "",
+        "## TOP STORIES",
+        top_stories,
+        "",
+        "## NEWS BY CATEGORY",
+    ]
+    for category in sections:
+        parts.extend(["", f"### {category}", generated.get(category, sections[category])])
+
+    parts.extend(
+        [
+            "",
+            "## EMERGING TRENDS",
+            trends or "No clear trends identified today.",
+            "",
+            "## NOTABLE MENTIONS",
+            generated.get(NOTABLE_MENTIONS_KEY, "- None identified"),
+            "",
+            "## STATISTICS",
+            f"- Total Articles Analyzed: {count_articles(sections)}",
+            f"- Sources Covered: {count_sources(sections, articles)}",
+            f"- Categories Represented: {len(sections)}",
+            "",
+            "---",
+            "Report generated by AI News Aggregator",
+            "Powered by CrewAI + Ollama (Llama 3)",
+            "",
+        ]
+    )
+    return "\n".join(parts)
+
+
+def write_single_call_report(
+    llm, categorized_text: str, trends: str = "", report_date: Optional[str] = None
+) -> str:
+    """Write the whole report in one call from the raw categorized text.
+
+    Used when the categorizer's output cannot be split into sections, so an
+    unexpected format degrades to the slower path instead of an empty report.
+
+    Args:
+        llm: The language model to use
+        categorized_text: Raw output of the categorization task
+        trends: Precomputed trend list, if any
+        report_date: Report date (defaults to today)
+
+    Returns:
+        The complete report as Markdown
+    """
+    report_date = report_date or datetime.now().strftime("%Y-%m-%d")
+    trends_note = f"\n\nBase the EMERGING TRENDS section on:\n{trends}" if trends else ""
+    messages = [
+        {
+            "role": "user",
+            "content": f"""Write a daily AI news report dated {report_date} from the
+categorized articles below, with these sections: EXECUTIVE SUMMARY, TOP STORIES,
+NEWS BY CATEGORY, EMERGING TRENDS, NOTABLE MENTIONS and STATISTICS. Start with
+"# AI NEWS DAILY REPORT" and use only the articles given.{trends_note}
+
+{categorized_text}""",
+        }
+    ]
+    return str(llm.call(messages)).strip()
+
+
+def write_fanout_report(
+    llm,
+    categorized_text: str,
+    output_file: str = "outputs/daily_report.md",
+    max_workers: Optional[int] = None,
+    trends: Optional[str] = None,
+    assembly_llm=None,
+    articles: Optional[List[Dict[str, Any]]] = None,
+) -> str:
+    """Build the daily report from categorized output using fan-out sections.
+
+    Args:
+        llm: The language model to use for the sections
+        categorized_text: Raw output of the categorization task
+        output_file: Where to write the finished report
+        max_workers: Maximum concurrent section calls
+        trends: Precomputed trend list (defaults to the categorizer's
+            TRENDING TOPICS line)
+        assembly_llm: Cheaper model for the executive summary (defaults to llm)
+        articles: Structured articles used for the source statistic
+
+    Returns:
+        The complete report as Markdown
+    """
+    sections = split_categorized_output(categorized_text)
+    if not sections and categorized_text.strip():
+        print("[!] No category sections found, writing the report in one call")
+        report = write_single_call_report(llm, categorized_text, trends=trends or "")
+    else:
+        generated = generate_report_sections(
+            llm, sections, max_workers=max_workers, summary_llm=assembly_llm
+        )
+        report = assemble_report(
+            generated,
+            sections,
+            trends=trends or extract_trending_topics(categorized_text),
+            articles=articles,
+        )
+
+    path = Path(output_file)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(report, encoding="utf-8")
+    return report
@@ -1,42 +1,5 @@
 """AI News Sources Configuration."""
 
-NEWS_SOURCES = [
-    {
-        "name": "MIT Technology Review - AI",
-        "url": "https://www.technologyreview.com/topic/artificial-intelligence/",
-        "type": "tech_review",
-    },
-    {
-        "name": "VentureBeat AI",
-        "url": "https://venturebeat.com/category/ai/",
-        "type": "tech_news",
-    },
-    {
-        "name": "The Verge - AI",
-        "url": "https://www.theverge.com/ai-artificial-intelligence",
-        "type": "tech_news",
-    },
-    {
-        "name": "Ars Technica - AI",
-        "url": "https://arstechnica.com/ai/",
-        "type": "tech_news",
-    },
-    {
-        "name": "TechCrunch - AI",
-        "url": "https://techcrunch.com/category/artificial-intelligence/",
-        "type": "tech_news",
-    },
-]
+from news_catalog import AI_CATEGORIES, NEWS_SOURCES, source_for_url
 
-AI_CATEGORIES = [
-    "Large Language Models (LLM)",
-    "Computer Vision",
-    "Natural Language Processing (NLP)",
-    "Reinforcement Learning",
-    "Robotics & Automation",
-    "AI Ethics & Safety",
-    "AI Business & Industry",
-    "AI Research & Papers",
-    "Generative AI",
-    "Machine Learning",
-]
+__all__ = ["AI_CATEGORIES", "NEWS_SOURCES", "source_for_url"]
@@ -1,14 +1,67 @@
 """Web Scraper Tool for AI News Collection."""
 
+import io
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 from crewai.tools import BaseTool
 from pydantic import Field
-from typing import Type, Optional, List, Dict, Any
+from typing import Type, Optional, List, Dict, Any, Callable
 from pydantic import BaseModel
 import re
+import sys
+import threading
+import tracemalloc
 from datetime import datetime
 
+from .news_sources import source_for_url
+
+# Size caps for a single page; news front pages are well under 1 MB
+MAX_RESPONSE_BYTES = 2 * 1024 * 1024
+MAX_DECODED_BYTES = 8 * 1024 * 1024
+CHUNK_SIZE = 16 * 1024
+
+# tracemalloc is process-wide: concurrent scrapes share one tracer, started
+# by the first active scrape and stopped by the last one
+_tracer_lock = threading.Lock()
+_tracer_users = 0
+_tracer_owned = False
+
+
+def _acquire_tracer() -> None:
+    """Register an active scrape, starting the tracer if none is running."""
+    global _tracer_users, _tracer_owned
+    with _tracer_lock:
+        if _tracer_users == 0:
+            _tracer_owned = not tracemalloc.is_tracing()
+            if _tracer_owned:
+                tracemalloc.start()
+        _tracer_users += 1
+
+
+def _release_tracer() -> int:
+    """Unregister an active scrape, stopping the tracer after the last one.
+
+    Returns:
+        Process-wide peak traced memory since the tracer was started
+    """
+    global _tracer_users
+    with _tracer_lock:
+        _, peak = tracemalloc.get_traced_memory()
+        _tracer_users -= 1
+        if _tracer_users == 0 and _tracer_owned:
+            tracemalloc.stop()
+        return peak
+
+
+def _tree_bytes(soup: BeautifulSoup) -> int:
+    """Estimate the memory held by a parse tree from its nodes and attributes."""
+    size = sys.getsizeof(soup)
+    for node in soup.descendants:
+        size += sys.getsizeof(node)
+        if isinstance(node, Tag):
+            size += sys.getsizeof(node.attrs)
+    return size
+
 
 class ScraperInput(BaseModel):
     """Input schema for the scraper tool."""
@@ -19,6 +72,10 @@ class ScraperInput(BaseModel):
     )
 
 
+class ResponseTooLargeError(requests.RequestException):
+    """Raised when a page exceeds the scraper's download or decoded size cap."""
+
+
 class AINewsScraper(BaseTool):
     """Tool for scraping AI news from various sources."""
 
@@ -29,6 +86,26 @@ class AINewsScraper(BaseTool):
     Use this tool to collect news from AI news websites.
     """
     args_schema: Type[BaseModel] = ScraperInput
+    on_articles: Optional[Callable[[List[Dict[str, Any]]], None]] = Field(
+        default=None,
+        description="Optional hook called with the extracted articles, e.g. to index them",
+    )
+    max_response_bytes: int = Field(
+        default=MAX_RESPONSE_BYTES,
+        description="Hard cap on bytes read off the wire per page",
+    )
+    max_decoded_bytes: int = Field(
+        default=MAX_DECODED_BYTES,
+        description="Hard cap on the decompressed page size",
+    )
+    trace_memory: bool = Field(
+        default=False,
+        description="Trace the process-wide peak with tracemalloc (slows every allocation)",
+    )
+    memory_stats: Dict[str, Dict[str, int]] = Field(
+        default_factory=dict,
+        description="Page and parse tree sizes, plus the traced peak if enabled, per scraped URL",
+    )
 
     def _run(self, url: str, max_articles: int = 10) -> str:
         """Execute the scraping operation.
@@ -41,18 +118,17 @@ class AINewsScraper(BaseTool):
             Formatted string with scraped articles
         """
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            }
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, "lxml")
-            articles = self._extract_articles(soup, url, max_articles)
+            articles = self.scrape_articles(url, max_articles)
 
             if not articles:
                 return f"No articles found at {url}"
 
+            if self.on_articles:
+                try:
+                    self.on_articles(articles)
+                except Exception as e:
+                    print(f"[!] Article hook failed for {url}: {e}")
+
             return self._format_articles(articles)
 
         except requests.RequestException as e:
@@ -60,6 +136,88 @@ class AINewsScraper(BaseTool):
         except Exception as e:
             return f"Unexpected error: {str(e)}"
 
+    def scrape_articles(self, url: str, max_articles: int = 10) -> List[Dict[str, Any]]:
+        """Download a page and extract its articles within bounded memory.
+
+        The parse tree is released as soon as the records are extracted.
+        memory_stats records this source's downloaded bytes and estimated
+        parse tree size. With trace_memory set it also records the
+        process-wide traced peak, which includes any scrapes running at the
+        same time; tracing is off by default since it slows every
+        allocation in the process.
+
+        Args:
+            url: The URL to scrape
+            max_articles: Maximum number of articles to return
+
+        Returns:
+            List of article dictionaries
+
+        Raises:
+            requests.RequestException: On network errors or oversized pages
+        """
+        if self.trace_memory:
+            _acquire_tracer()
+        try:
+            content = self._download(url)
+            size = len(content)
+            soup = BeautifulSoup(content, "lxml")
+            del content
+            articles = self._extract_articles(soup, url, max_articles)
+            tree_size = _tree_bytes(soup)
+            soup.decompose()
+            del soup
+        finally:
+            if self.trace_memory:
+                peak = _release_tracer()
+
+        self.memory_stats[url] = {"page_bytes": size, "tree_bytes": tree_size}
+        if self.trace_memory:
+            self.memory_stats[url]["process_peak_bytes"] = peak
+        source = source_for_url(url)
+        for article in articles:
+            article["source"] = source
+        return articles
+
+    def _download(self, url: str) -> bytes:
+        """Stream a page into memory, enforcing the size caps.
+
+        Args:
+            url: The URL to download
+
+        Returns:
+            The decoded page body
+
+        Raises:
+            ResponseTooLargeError: If a size cap is exceeded
+        """
+        headers = {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+        }
+        with requests.get(url, headers=headers, timeout=15, stream=True) as response:
+            response.raise_for_status()
+
+            length = response.headers.get("Content-Length", "")
+            if length.isdigit() and int(length) > self.max_response_bytes:
+                raise ResponseTooLargeError(
+                    f"Content-Length {length} exceeds {self.max_response_bytes} bytes"
+                )
+
+            # BytesIO hands its buffer to getvalue() without copying it
+            body = io.BytesIO()
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                body.write(chunk)
+                # raw.tell() counts compressed bytes read off the wire
+                if response.raw.tell() > self.max_response_bytes:
+                    raise ResponseTooLargeError(
+                        f"Response exceeds {self.max_response_bytes} bytes"
+                    )
+                if body.tell() > self.max_decoded_bytes:
+                    raise ResponseTooLargeError(
+                        f"Decoded response exceeds {self.max_decoded_bytes} bytes"
+                    )
+            return body.getvalue()
+
     def _extract_articles(
         self, soup: BeautifulSoup, base_url: str, max_articles: int
     ) -> List[Dict[str, Any]]: